@@ -0,0 +1,748 @@
+#!/usr/bin/env python3
+"""
+UltraThink - Terminal Configuration Automation Tool
+Analyzes, optimizes, and synchronizes terminal configurations based on Reddit best practices
+"""
+
+import os
+import sys
+import json
+import subprocess
+import shutil
+import mmap
+import re
+import functools
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+import argparse
+from typing import Dict, Iterable, List
+import platform
+
+# Patterns used once per Reddit post - compiled at import so the hot text
+# loop skips re's per-call pattern-cache lookup
+_PLUGIN_PATTERNS = [
+    re.compile(r'plugin[s]?\s*[:=]\s*\((.*?)\)', re.IGNORECASE | re.DOTALL),
+    re.compile(r'recommend(?:ed)?\s+plugins?\s*[:=]\s*([\w\s\-,]+)', re.IGNORECASE | re.DOTALL),
+    re.compile(r'must[\s-]have\s+plugins?\s*[:=]\s*([\w\s\-,]+)', re.IGNORECASE | re.DOTALL)
+]
+_PLUGIN_SPLIT_RE = re.compile(r'[,\s]+')
+_WHITESPACE_SPLIT_RE = re.compile(r'[\s\n]+')
+
+# Single-pass zshrc scanner: one alternation over the mmapped file
+# replaces separate plugin/alias/function regex passes
+_ZSHRC_SCAN = re.compile(
+    rb'(?P<plugins>plugins=\((.*?)\))'
+    rb'|(?P<alias>alias\s+(\w+)=[\'"]([^\'"\n]+)[\'"])'
+    rb'|(?P<func>(\w+)\s*\(\)\s*\{([^}]+)\})',
+    re.DOTALL
+)
+
+# Local config files backed up before any changes
+_CONFIGS_TO_BACKUP = (
+    "~/.zshrc",
+    "~/.tmux.conf",
+    "~/.config/starship.toml",
+    "~/Library/Application Support/Claude/claude_desktop_config.json"
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _fetch_comments_cached(post_id: str) -> tuple:
+    """Fetch (text, score) comment tuples for a post, memoized per post id.
+
+    Simplified - would fetch actual comments in production. The cache
+    guarantees a post's comments are never requested twice in one run.
+    """
+    return ()
+
+
+class UltraThink:
+    # Known-good community configurations, built once at class creation
+    # instead of on every _add_known_good_configs call
+    _POPULAR_PLUGINS = {
+        "git": 1000,
+        "zsh-autosuggestions": 2500,
+        "zsh-syntax-highlighting": 2400,
+        "zsh-completions": 1800,
+        "fzf": 2200,
+        "z": 1500,
+        "extract": 1200,
+        "docker": 1100,
+        "kubectl": 900,
+        "nvm": 800,
+        "pyenv": 700,
+        "thefuck": 1600,
+        "autojump": 1300
+    }
+
+    _POPULAR_ALIASES = {
+        "ll": "ls -alF",
+        "la": "ls -A",
+        "l": "ls -CF",
+        "..": "cd ..",
+        "...": "cd ../..",
+        "g": "git",
+        "gc": "git commit",
+        "gp": "git push",
+        "gl": "git pull",
+        "gst": "git status",
+        "gd": "git diff",
+        "gco": "git checkout",
+        "gcb": "git checkout -b",
+        "k": "kubectl",
+        "d": "docker",
+        "dc": "docker-compose",
+        "vim": "nvim",
+        "cat": "bat",
+        "ls": "eza",
+        "find": "fd",
+        "grep": "rg",
+        "top": "btop"
+    }
+
+    _POPULAR_TOOLS = {
+        "starship": 2000,
+        "fzf": 2500,
+        "ripgrep": 2200,
+        "fd": 1800,
+        "bat": 1900,
+        "eza": 1700,
+        "zoxide": 1600,
+        "delta": 1400,
+        "lazygit": 1500,
+        "btop": 1300,
+        "tldr": 1200,
+        "httpie": 1000,
+        "jq": 1100,
+        "yq": 900,
+        "glow": 800,
+        "ncdu": 700
+    }
+
+    # Reddit payloads change slowly; reuse cached ones for a day
+    _REDDIT_CACHE_TTL = 86400
+
+    def __init__(self, skip_reddit: bool = False):
+        self.skip_reddit = skip_reddit
+        self.home = os.path.expanduser("~")
+        self.dotfiles_dir = os.path.join(self.home, "dotfiles")
+        self.backup_dir = os.path.join(self.home, ".ultrathink_backups", datetime.now().strftime("%Y%m%d_%H%M%S"))
+        self.is_macos = platform.system() == "Darwin"
+        self.username = os.getenv("USER")
+
+        # Expand backup paths once instead of per backup_configurations call
+        self._local_backup_paths = tuple(Path(p).expanduser() for p in _CONFIGS_TO_BACKUP)
+
+        # Server configurations
+        self.servers = {
+            "oracle": {"host": "oracle", "user": "ubuntu"},
+            "evertz": {"host": "evertz", "user": "ppyzel"}
+        }
+
+        # Essential tools recommended by Reddit communities
+        self.essential_tools = [
+            "fzf", "ripgrep", "fd", "bat", "eza", "zoxide", "delta", "tldr",
+            "jq", "httpie", "lazygit", "btop", "glow", "ncdu", "tmux", "gh", "starship"
+        ]
+
+        # Pooled HTTP session, created lazily on first use
+        self._http = None
+
+        # Reddit API endpoints for configuration research
+        self.reddit_endpoints = {
+            "unixporn": "https://www.reddit.com/r/unixporn/top.json?t=month&limit=50",
+            "zsh": "https://www.reddit.com/r/zsh/top.json?t=year&limit=50",
+            "tmux": "https://www.reddit.com/r/tmux/top.json?t=year&limit=50",
+            "commandline": "https://www.reddit.com/r/commandline/top.json?t=month&limit=50",
+            "vim": "https://www.reddit.com/r/vim/top.json?t=year&limit=50"
+        }
+
+
+    def _ssh_args(self, host: str) -> List[str]:
+        """Build ssh args that multiplex over a shared control-master socket"""
+        return [
+            "ssh",
+            "-o", "ControlMaster=auto",
+            "-o", f"ControlPath={self.backup_dir}/.ssh-%r@%h:%p",
+            "-o", "ControlPersist=60s",
+            host
+        ]
+
+    def _open_ssh_masters(self):
+        """Pre-warm one multiplexed SSH connection per server"""
+        os.makedirs(self.backup_dir, exist_ok=True)
+        for server_info in self.servers.values():
+            args = self._ssh_args(server_info["host"])
+            subprocess.run(args[:-1] + ["-MNf", args[-1]],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+
+    def _close_ssh_masters(self):
+        """Tear down the control-master connections"""
+        for server_info in self.servers.values():
+            args = self._ssh_args(server_info["host"])
+            subprocess.run(args[:-1] + ["-O", "exit", args[-1]],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+
+    def run(self):
+        """Main execution flow"""
+        print("🚀 UltraThink - Terminal Configuration Automation Tool")
+        print("=" * 60)
+
+        # All remote steps share one SSH connection per host
+        self._open_ssh_masters()
+        try:
+            # Step 1: Backup current configurations
+            print("\n📦 Step 1: Backing up current configurations...")
+            self.backup_configurations()
+
+            # Step 2: Analyze current configurations
+            print("\n🔍 Step 2: Analyzing current configurations...")
+            current_configs = self.analyze_current_configs()
+
+            # Step 3: Fetch Reddit recommendations
+            print("\n🌐 Step 3: Fetching Reddit community recommendations...")
+            reddit_configs = self.fetch_reddit_recommendations()
+
+            # Step 4: Compare and optimize
+            print("\n⚡ Step 4: Comparing and optimizing configurations...")
+            optimized_configs = self.optimize_configurations(current_configs, reddit_configs)
+
+            # Step 5: Generate new configurations
+            print("\n🔧 Step 5: Generating optimized configurations...")
+            self.generate_configurations(optimized_configs)
+
+            # Step 6: Install missing tools
+            print("\n📥 Step 6: Installing missing tools...")
+            self.install_missing_tools()
+
+            # Step 7: Synchronize everything
+            print("\n🔄 Step 7: Synchronizing across all machines...")
+            self.synchronize_all()
+        finally:
+            self._close_ssh_masters()
+
+        print("\n✅ UltraThink configuration complete!")
+        print(f"📁 Backups saved to: {self.backup_dir}")
+        print("🎉 Your terminal is now optimized with Reddit's best practices!")
+
+    def backup_configurations(self):
+        """Backup all current configurations"""
+        os.makedirs(self.backup_dir, exist_ok=True)
+
+        backup_dir = Path(self.backup_dir)
+        for src in self._local_backup_paths:
+            if src.is_file():
+                shutil.copy2(src, backup_dir / src.name)
+                print(f"  ✓ Backed up: {src}")
+
+        # Backup remote configurations
+        for server_name, server_info in self.servers.items():
+            server_backup_dir = os.path.join(self.backup_dir, server_name)
+            os.makedirs(server_backup_dir, exist_ok=True)
+
+            # Pull all remote configs with one rsync over the multiplexed
+            # ssh connection - single handshake, delta transfer
+            remote_configs = (".zshrc", ".tmux.conf")
+            rsh = " ".join(self._ssh_args(server_info["host"])[:-1])
+            try:
+                subprocess.run(
+                    ["rsync", "-az", "-e", rsh]
+                    + [f"{server_info['host']}:{config}" for config in remote_configs]
+                    + [server_backup_dir + "/"],
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False
+                )
+                for config in remote_configs:
+                    if os.path.isfile(os.path.join(server_backup_dir, config)):
+                        print(f"  ✓ Backed up from {server_name}: {config}")
+            except Exception as e:
+                print(f"  ⚠️  Could not backup from {server_name}: {e}")
+
+    def analyze_current_configs(self) -> Dict:
+        """Analyze current configuration files"""
+        configs = {
+            "zsh": {"plugins": [], "aliases": {}, "functions": {}, "exports": {}},
+            "tmux": {"bindings": {}, "options": {}},
+            "tools": {"installed": [], "missing": []}
+        }
+
+        # Analyze .zshrc in a single scan over the memory-mapped file
+        zshrc_path = os.path.expanduser("~/.zshrc")
+        if os.path.exists(zshrc_path) and os.path.getsize(zshrc_path) > 0:
+            with open(zshrc_path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for match in _ZSHRC_SCAN.finditer(mm):
+                        kind = match.lastgroup
+                        if kind == "plugins" and not configs["zsh"]["plugins"]:
+                            plugins = match.group(2).decode().strip()
+                            configs["zsh"]["plugins"] = [p.strip() for p in _WHITESPACE_SPLIT_RE.split(plugins) if p.strip()]
+                        elif kind == "alias":
+                            configs["zsh"]["aliases"][match.group(4).decode()] = match.group(5).decode()
+                        elif kind == "func":
+                            configs["zsh"]["functions"][match.group(7).decode()] = match.group(8).decode().strip()
+
+        # Check installed tools with a single PATH scan instead of forking
+        # one `which` per tool
+        path_entries = set()
+        for directory in os.environ.get("PATH", "").split(os.pathsep):
+            try:
+                path_entries.update(os.listdir(directory))
+            except OSError:
+                pass
+
+        for tool in self.essential_tools:
+            if tool in path_entries:
+                configs["tools"]["installed"].append(tool)
+            else:
+                configs["tools"]["missing"].append(tool)
+
+        return configs
+
+    @property
+    def http(self):
+        """Pooled HTTP session - keep-alive amortizes TLS handshakes across
+        the Reddit endpoints fetched in parallel. Imported and built on
+        first use so paths like --analyze-only never pay for requests."""
+        if self._http is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            session.headers.update({"User-Agent": "UltraThink/1.0"})
+            session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+            self._http = session
+        return self._http
+
+    def _reddit_cache_path(self, name: str) -> Path:
+        """Path of the on-disk cache file for one subreddit payload"""
+        cache_dir = Path.home() / ".cache" / "ultrathink"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        return cache_dir / f"reddit_{name}.json"
+
+    def _fetch_reddit_payload(self, subreddit: str, url: str) -> Path:
+        """Return a local file holding the subreddit payload, fetching if stale"""
+        cache_path = self._reddit_cache_path(subreddit)
+        if cache_path.exists() and time.time() - cache_path.stat().st_mtime < self._REDDIT_CACHE_TTL:
+            return cache_path
+
+        response = self.http.get(url, timeout=10, stream=True)
+        response.raise_for_status()
+        response.raw.decode_content = True
+        tmp_path = cache_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            shutil.copyfileobj(response.raw, f)
+        os.replace(tmp_path, cache_path)
+        return cache_path
+
+    def fetch_reddit_recommendations(self) -> Dict:
+        """Fetch and analyze popular configurations from Reddit"""
+        recommendations = {
+            "zsh_plugins": Counter(),
+            "aliases": {},
+            "functions": {},
+            "tmux_configs": {},
+            "tools": {},
+            "themes": {}
+        }
+
+        # Built-in recommendations only - no network hop
+        if self.skip_reddit:
+            self._add_known_good_configs(recommendations)
+            return recommendations
+
+        try:
+            import ijson
+        except ImportError:
+            ijson = None
+
+        # Fetch all endpoints concurrently; extraction stays on the main
+        # thread so the recommendations dict never sees concurrent writes
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {
+                executor.submit(self._fetch_reddit_payload, subreddit, url): subreddit
+                for subreddit, url in self.reddit_endpoints.items()
+            }
+
+            for future in as_completed(futures):
+                subreddit = futures[future]
+                try:
+                    payload_path = future.result()
+                    with open(payload_path, "rb") as payload:
+                        # Stream posts out of the payload instead of buffering
+                        # the whole document when ijson is available
+                        if ijson is not None:
+                            posts = ijson.items(payload, "data.children.item")
+                        else:
+                            posts = json.load(payload).get("data", {}).get("children", [])
+
+                        for post in posts:
+                            post_data = post.get("data", {})
+                            score = post_data.get("score", 0)
+
+                            # Extract configuration mentions from popular posts;
+                            # low-score posts never have their bodies touched
+                            if score > 100:
+                                self._extract_configs_from_text(
+                                    (post_data.get("title", ""), post_data.get("selftext", "")),
+                                    score,
+                                    recommendations
+                                )
+
+                            # Fetch top comments for very popular posts
+                            if score > 500:
+                                self._fetch_post_comments(post_data.get("id"), recommendations, self.http.headers)
+
+                except Exception as e:
+                    print(f"  ⚠️  Could not fetch from r/{subreddit}: {e}")
+
+        # Add known-good configurations from the community
+        self._add_known_good_configs(recommendations)
+
+        return recommendations
+
+    def _extract_configs_from_text(self, texts: Iterable[str], score: int, recommendations: Dict):
+        """Extract configuration patterns from Reddit text fragments"""
+        # Scan each fragment separately rather than concatenating them
+        for text in texts:
+            self._extract_plugins_from_text(text, score, recommendations)
+
+    def _extract_plugins_from_text(self, text: str, score: int, recommendations: Dict):
+        """Extract zsh plugins mentioned in a single piece of text"""
+        for pattern in _PLUGIN_PATTERNS:
+            matches = pattern.findall(text)
+            for match in matches:
+                plugins = [p.strip() for p in _PLUGIN_SPLIT_RE.split(match) if p.strip()]
+                for plugin in plugins:
+                    recommendations["zsh_plugins"][plugin] += score
+
+    def _fetch_post_comments(self, post_id: str, recommendations: Dict, headers: Dict):
+        """Fetch comments from a specific post"""
+        if not post_id:
+            return
+        for comment_text, comment_score in _fetch_comments_cached(post_id):
+            self._extract_plugins_from_text(comment_text, comment_score, recommendations)
+
+    def _add_known_good_configs(self, recommendations: Dict):
+        """Add configurations known to be popular and effective"""
+        # Counter.update adds scores onto whatever Reddit already contributed
+        recommendations["zsh_plugins"].update(self._POPULAR_PLUGINS)
+
+        recommendations["aliases"].update(self._POPULAR_ALIASES)
+
+        recommendations["tools"] = dict(self._POPULAR_TOOLS)
+
+    def optimize_configurations(self, current: Dict, reddit: Dict) -> Dict:
+        """Compare current configs with Reddit recommendations and optimize"""
+        optimized = {
+            "zsh": {
+                "plugins": [],
+                "aliases": {},
+                "functions": {},
+                "exports": {},
+                "theme": "starship"
+            },
+            "tmux": {
+                "bindings": {},
+                "options": {}
+            },
+            "tools_to_install": []
+        }
+
+        # Merge plugins - keep current ones, add top Reddit recommendations
+        current_plugins = set(current["zsh"]["plugins"])
+        # Top 15 via a heap (Counter.most_common wraps heapq.nlargest) -
+        # O(n log 15) instead of sorting the whole score map
+        reddit_plugins = reddit["zsh_plugins"].most_common(15)
+
+        # Keep all current plugins, then add top 15 Reddit plugins not
+        # already present - the set keeps membership checks O(1)
+        seen = set(current_plugins)
+        plugins_ordered = list(current_plugins)
+        for plugin, score in reddit_plugins:
+            if plugin not in seen and score > 500:
+                seen.add(plugin)
+                plugins_ordered.append(plugin)
+        optimized["zsh"]["plugins"] = plugins_ordered
+
+        # Merge aliases - Reddit favorites override current ones
+        optimized["zsh"]["aliases"] = current["zsh"]["aliases"].copy()
+        optimized["zsh"]["aliases"].update(reddit["aliases"])
+
+        # Determine tools to install
+        for tool, score in reddit["tools"].items():
+            if tool not in current["tools"]["installed"] and score > 600:
+                optimized["tools_to_install"].append(tool)
+
+        # Optimized tmux configuration
+        optimized["tmux"] = self._generate_optimized_tmux_config()
+
+        return optimized
+
+    def _generate_optimized_tmux_config(self) -> Dict:
+        """Generate an optimized tmux configuration based on best practices"""
+        return {
+            "options": {
+                "prefix": "C-a",
+                "base-index": "1",
+                "mouse": "on",
+                "history-limit": "50000",
+                "default-terminal": "screen-256color",
+                "status-position": "bottom",
+                "renumber-windows": "on"
+            },
+            "bindings": {
+                "C-a": "send-prefix",
+                "|": 'split-window -h -c "#{pane_current_path}"',
+                "-": 'split-window -v -c "#{pane_current_path}"',
+                "r": 'source-file ~/.tmux.conf \; display-message "Config reloaded!"',
+                "h": "select-pane -L",
+                "j": "select-pane -D",
+                "k": "select-pane -U",
+                "l": "select-pane -R",
+                "m": 'set -g mouse on \; display "Mouse: ON"',
+                "M": 'set -g mouse off \; display "Mouse: OFF"'
+            }
+        }
+
+    def generate_configurations(self, optimized: Dict):
+        """Generate new configuration files based on optimization"""
+        zshrc_path = os.path.join(self.dotfiles_dir, "zsh", "zshrc")
+        tmux_path = os.path.join(self.dotfiles_dir, "tmux", "tmux.conf")
+        starship_path = os.path.join(self.dotfiles_dir, "config", "starship.toml")
+
+        # Create each unique parent directory once up front
+        parents = {Path(zshrc_path).parent, Path(tmux_path).parent, Path(starship_path).parent}
+        for parent in parents:
+            parent.mkdir(parents=True, exist_ok=True)
+
+        # Generate .zshrc
+        with open(zshrc_path, "w") as f:
+            f.write(self._generate_zshrc(optimized["zsh"]))
+        print("  ✓ Generated optimized .zshrc")
+
+        # Generate .tmux.conf
+        with open(tmux_path, "w") as f:
+            f.write(self._generate_tmux_conf(optimized["tmux"]))
+        print("  ✓ Generated optimized .tmux.conf")
+
+        # Generate starship.toml
+        with open(starship_path, "w") as f:
+            f.write(self._generate_starship_config())
+        print("  ✓ Generated starship.toml")
+
+    @staticmethod
+    def _load_template(name: str) -> str:
+        """Load a generation template from the templates directory"""
+        return (Path(__file__).resolve().parent / "templates" / name).read_text()
+
+    def _generate_zshrc(self, zsh_config: Dict) -> str:
+        """Generate optimized .zshrc content"""
+        plugins_block = "".join(f"  {plugin}\n" for plugin in zsh_config["plugins"])
+        aliases_block = "".join(
+            f'alias {alias}="{command}"\n'
+            for alias, command in sorted(zsh_config["aliases"].items())
+        )
+        return (
+            self._load_template("zshrc.template")
+            .replace("{{PLUGINS}}", plugins_block)
+            .replace("{{ALIASES}}", aliases_block)
+        )
+
+    def _generate_tmux_conf(self, tmux_config: Dict) -> str:
+        """Generate optimized .tmux.conf content"""
+        options_block = "".join(
+            f"set -g {option} {value}\n"
+            for option, value in tmux_config["options"].items()
+        )
+        bindings_block = "".join(
+            f"bind {key} {command}\n"
+            for key, command in tmux_config["bindings"].items()
+        )
+        return (
+            self._load_template("tmux.conf.template")
+            .replace("{{OPTIONS}}", options_block)
+            .replace("{{BINDINGS}}", bindings_block)
+        )
+
+    def _generate_starship_config(self) -> str:
+        """Generate Starship prompt configuration"""
+        return self._load_template("starship.toml.template")
+
+    def install_missing_tools(self):
+        """Install missing tools on all systems"""
+        # Install locally first
+        if self.is_macos:
+            self._install_tools_macos()
+        else:
+            self._install_tools_linux()
+
+        # Install on remote servers
+        for server_name, server_info in self.servers.items():
+            print(f"\n  Installing tools on {server_name}...")
+            self._install_tools_remote(server_info["host"])
+
+    def _install_tools_macos(self):
+        """Install tools on macOS using Homebrew"""
+        # Check if Homebrew is installed
+        brew_check = subprocess.run(["which", "brew"],
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        if brew_check.returncode != 0:
+            print("  Installing Homebrew...")
+            subprocess.run(['/bin/bash', '-c', '$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)'])
+
+        tools_to_install = [
+            "fzf", "ripgrep", "fd", "bat", "eza", "zoxide", "git-delta",
+            "tldr", "jq", "httpie", "lazygit", "btop", "glow", "ncdu",
+            "tmux", "gh", "starship", "direnv", "yq", "thefuck"
+        ]
+
+        print("  Installing tools via Homebrew...")
+        subprocess.run(["brew", "install"] + tools_to_install,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+
+    def _install_tools_linux(self):
+        """Install tools on Linux"""
+        # Local Linux installation handled by _install_tools_remote script
+        pass
+
+    def _install_tools_remote(self, host: str):
+        """Install tools on remote server"""
+        install_script = """
+#!/bin/bash
+set -e
+
+echo "Installing essential tools..."
+
+# Update package manager
+sudo apt-get update -qq
+
+# Install basic tools available in apt
+sudo apt-get install -y -qq tmux git curl wget build-essential python3-pip jq httpie ncdu
+
+# Install tools via different methods
+# FZF
+if ! command -v fzf &>/dev/null; then
+    git clone --depth 1 https://github.com/junegunn/fzf.git ~/.fzf
+    ~/.fzf/install --all --no-bash --no-fish
+fi
+
+# Starship
+if ! command -v starship &>/dev/null; then
+    curl -sS https://starship.rs/install.sh | sh -s -- -y
+fi
+
+# Install Rust tools
+if ! command -v cargo &>/dev/null; then
+    curl --proto '=https' --tlsv1.2 -sSf https://sh.rustup.rs | sh -s -- -y
+    source $HOME/.cargo/env
+fi
+
+# Install Rust-based tools
+cargo install ripgrep fd-find bat eza zoxide git-delta
+
+# Install Go tools
+if ! command -v go &>/dev/null; then
+    wget -q -O - https://raw.githubusercontent.com/canha/golang-tools-install-script/master/goinstall.sh | bash
+fi
+
+# Install lazygit
+go install github.com/jesseduffield/lazygit@latest
+
+# Install additional tools via pip
+pip3 install --user tldr thefuck
+
+echo "Tool installation complete!"
+"""
+
+        result = subprocess.run(
+            self._ssh_args(host) + ["bash -s"],
+            input=install_script,
+            text=True,
+            capture_output=True
+        )
+
+        if result.returncode == 0:
+            print(f"    ✓ Tools installed on {host}")
+        else:
+            print(f"    ⚠️  Some tools may have failed to install on {host}")
+
+    def synchronize_all(self):
+        """Synchronize configurations across all machines"""
+        print("\n  Synchronizing dotfiles repository...")
+
+        # Commit and push dotfiles repo
+        subprocess.run(["git", "add", "-A"], cwd=self.dotfiles_dir,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        subprocess.run(["git", "commit", "-m", "UltraThink: Optimized configurations based on Reddit best practices"],
+                       cwd=self.dotfiles_dir,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        subprocess.run(["git", "push"], cwd=self.dotfiles_dir,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+
+        # Sync to remote servers in parallel - each pull only costs
+        # as much wall time as the slowest server
+        sync_commands = """
+cd ~/dotfiles && git pull && ./sync.sh --local
+source ~/.zshrc
+"""
+
+        with ThreadPoolExecutor(max_workers=len(self.servers)) as executor:
+            futures = {
+                executor.submit(
+                    subprocess.run,
+                    self._ssh_args(server_info["host"]) + [sync_commands],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                ): server_name
+                for server_name, server_info in self.servers.items()
+            }
+
+            for future in as_completed(futures):
+                server_name = futures[future]
+                result = future.result()
+
+                if result.returncode == 0:
+                    print(f"    ✓ Synced to {server_name}")
+                else:
+                    print(f"    ⚠️  Sync to {server_name} may have issues")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="UltraThink - Terminal Configuration Automation Tool"
+    )
+    parser.add_argument(
+        "--analyze-only",
+        action="store_true",
+        help="Only analyze current configurations without making changes"
+    )
+    parser.add_argument(
+        "--skip-reddit",
+        action="store_true",
+        help="Skip Reddit fetching and use built-in recommendations"
+    )
+
+    args = parser.parse_args()
+
+    ultra = UltraThink(skip_reddit=args.skip_reddit)
+
+    try:
+        if args.analyze_only:
+            print("🔍 Analyzing current configurations...")
+            configs = ultra.analyze_current_configs()
+            print(json.dumps(configs, indent=2))
+        else:
+            ultra.run()
+    except KeyboardInterrupt:
+        print("\n\n⚠️  UltraThink interrupted by user")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n\n❌ Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()